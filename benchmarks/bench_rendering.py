@@ -0,0 +1,129 @@
+"""
+bench_rendering
+~~~~~~~~
+
+Benchmark `tz_rendering.html_render_timezones()` against the pre-escaping
+implementation (which formatted every option on every render) and against
+a naive variant calling `html.escape()` on every option, on every render.
+
+Exits with status 1 if the current implementation is slower than the
+pre-escaping one by more than `--tolerance`.
+
+Usage::
+
+    make bench
+    poetry run python benchmarks/bench_rendering.py --number 10000 --tolerance 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import sys
+import timeit
+
+from timezones import tz_rendering, zones
+
+
+def legacy_html_render_timezones(select_name, current_selected=None):
+    """The rendering loop as it was before escaping was added."""
+    sel_checker = {"non_selected_yet": True}
+
+    def render_option(value, name, selected=False):
+        if selected and sel_checker["non_selected_yet"]:
+            is_selected = 'selected="selected"'
+            sel_checker["non_selected_yet"] = False
+        else:
+            is_selected = ""
+        return f'<option value="{value}" {is_selected}>{name}</option>'
+
+    def render_option_disabled():
+        return '<option disabled="disabled">--------------------</option>'
+
+    result = [f'<select name="{select_name}">']
+    result.append('<option value="">Select your timezone</option>')
+    result.append(render_option_disabled())
+
+    for tz in zones.get_timezones(only_us=True):
+        result.append(render_option(tz[1], tz[2], current_selected == tz[1]))
+    result.append(render_option_disabled())
+    for tz in zones.get_timezones():
+        result.append(render_option(tz[1], tz[2], current_selected == tz[1]))
+    result.append(render_option_disabled())
+    for tz in zones.get_timezones(only_fixed=True):
+        result.append(render_option(tz[1], tz[2], current_selected == tz[1]))
+
+    result.append("</select>")
+    return "\n".join(result)
+
+
+def naive_html_render_timezones(select_name, current_selected=None):
+    """The legacy loop, escaping every option on every render."""
+    sel_checker = {"non_selected_yet": True}
+
+    def render_option(value, name, selected=False):
+        if selected and sel_checker["non_selected_yet"]:
+            is_selected = 'selected="selected"'
+            sel_checker["non_selected_yet"] = False
+        else:
+            is_selected = ""
+        return (
+            f'<option value="{html.escape(value)}" {is_selected}>'
+            f"{html.escape(name)}</option>"
+        )
+
+    disabled = '<option disabled="disabled">--------------------</option>'
+    result = [f'<select name="{html.escape(select_name)}">']
+    result.append('<option value="">Select your timezone</option>')
+    result.append(disabled)
+
+    for tzs in (
+        zones.get_timezones(only_us=True),
+        zones.get_timezones(),
+        zones.get_timezones(only_fixed=True),
+    ):
+        for tz in tzs:
+            result.append(render_option(tz[1], tz[2], current_selected == tz[1]))
+        result.append(disabled)
+
+    result[-1] = "</select>"
+    return "\n".join(result)
+
+
+def bench(func, number: int, repeat: int) -> float:
+    """Return the best time per call, in microseconds."""
+    func("timezone", "Europe/London")  # Warm the caches
+    timings = timeit.repeat(
+        lambda: func("timezone", "Europe/London"), number=number, repeat=repeat
+    )
+    return min(timings) / number * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="allowed slowdown vs. legacy, as a fraction (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    legacy = bench(legacy_html_render_timezones, args.number, args.repeat)
+    naive = bench(naive_html_render_timezones, args.number, args.repeat)
+    current = bench(tz_rendering.html_render_timezones, args.number, args.repeat)
+
+    print(f"legacy (unescaped):  {legacy:8.1f}us/call")
+    print(f"naive html.escape(): {naive:8.1f}us/call")
+    print(f"current:             {current:8.1f}us/call ({current / legacy:.2f}x)")
+
+    if current > legacy * (1 + args.tolerance):
+        print("Regression: current rendering is slower than legacy", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
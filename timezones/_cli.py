@@ -0,0 +1,320 @@
+"""
+_cli
+~~~~~~~~
+
+Command-line interface, run with `python -m timezones`.
+
+It lives outside of `__main__` so worker processes started with `spawn`
+(the default on macOS and Windows) can import the functions they run.
+
+Example usage (validate timezone names, one per line)::
+
+    cat export.txt | python -m timezones validate --jobs 4
+        =>
+    prints the invalid names, exits with status 1 if there are any
+
+Example usage (dump the timezone tables)::
+
+    python -m timezones dump --format csv --group us
+
+Example usage (compile the bytecode, print cache statistics)::
+
+    python -m timezones warm
+    python -m timezones stats
+
+:license: MIT
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import compileall
+import csv
+import functools
+import io
+import itertools
+import json
+import os
+import sys
+import time
+import timeit
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+from . import tz_rendering, tz_utils, zones
+
+_GROUPS = ("all", "us", "fixed")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`): stop quietly, and point stdout
+        # at devnull so the interpreter doesn't fail flushing it at exit.
+        # See https://docs.python.org/3/library/signal.html#note-on-sigpipe
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
+
+# --- Commands ---------------------------------------------
+def _cmd_validate(args: argparse.Namespace) -> int:
+    # Exports may contain bytes that aren't valid UTF-8: read them as lone
+    # surrogates, so they are reported (byte for byte) as invalid names
+    # instead of aborting the run.
+    _reconfigure(sys.stdin)
+    _reconfigure(sys.stdout)
+    names = _iter_names(args.files or ["-"])
+    checked = invalid = 0
+
+    try:
+        for name, valid in _validate(names, args.batch_size, args.jobs):
+            checked += 1
+            if valid == args.valid:
+                print(name)
+            if not valid:
+                invalid += 1
+    except BrokenPipeError:
+        raise
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if not args.quiet:
+        print(f"{checked} checked, {invalid} invalid", file=sys.stderr)
+    return 1 if invalid else 0
+
+
+def _cmd_dump(args: argparse.Namespace) -> int:
+    rows = _get_group(args.group)
+    if args.format == "json":
+        json.dump(rows, sys.stdout, indent=args.indent)
+        sys.stdout.write("\n")
+    else:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(("offset", "name", "formatted"))
+        writer.writerows(rows)
+    return 0
+
+
+def _cmd_warm(args: argparse.Namespace) -> int:
+    # The cached tables only live in memory, so building them here wouldn't
+    # help any other process: bytecode is the only artifact that persists.
+    package_dir = str(Path(__file__).parent)
+    if not compileall.compile_dir(package_dir, quiet=1):
+        print(f"Failed to compile {package_dir}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"Compiled {package_dir}")
+    return 0
+
+
+def _cmd_stats(args: argparse.Namespace) -> int:
+    print(f"{'cache':<24} {'entries':>8} {'first call (ms)':>16}")
+    for name, seconds, size in _build_caches():
+        print(f"{name:<24} {size:>8} {seconds * 1000:>16.3f}")
+
+    render_seconds = timeit.timeit(
+        lambda: tz_rendering.html_render_timezones("timezone", "Europe/London"),
+        number=args.number,
+    )
+    print()
+    print(f"html_render_timezones: {render_seconds / args.number * 1e6:.1f}us/call")
+    return 0
+
+
+# --- Private ----------------------------------------------
+@functools.lru_cache(maxsize=4096)
+def _is_valid_timezone(name: str) -> bool:
+    return tz_utils.is_valid_timezone(name)
+
+
+def _validate_batch(names: list[str]) -> list[bool]:
+    return [_is_valid_timezone(name) for name in names]
+
+
+def _batched(names: Iterable[str], size: int) -> Iterator[list[str]]:
+    it = iter(names)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def _validate(
+    names: Iterable[str], batch_size: int, jobs: int
+) -> Iterator[tuple[str, bool]]:
+    """Yield `(name, is_valid)` pairs, in input order.
+
+    With `jobs > 1` each batch is deduplicated, and only its unique names are
+    resolved in worker processes. Only a few batches are in flight at any
+    time, so memory stays bounded however long the input is.
+    """
+    batches = _batched(names, batch_size)
+
+    if jobs <= 1:
+        for batch in batches:
+            yield from zip(batch, _validate_batch(batch))
+        return
+
+    def resolve(batch, unique, future):
+        results = dict(zip(unique, future.result()))
+        return ((name, results[name]) for name in batch)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: collections.deque = collections.deque()
+        for batch in batches:
+            unique = list(dict.fromkeys(batch))
+            future = executor.submit(_validate_batch, unique)
+            pending.append((batch, unique, future))
+            if len(pending) >= jobs * 2:
+                yield from resolve(*pending.popleft())
+        while pending:
+            yield from resolve(*pending.popleft())
+
+
+def _iter_names(files: list[str]) -> Iterator[str]:
+    for filename in files:
+        if filename == "-":
+            yield from _iter_lines(sys.stdin)
+        else:
+            with open(filename, encoding="utf-8", errors="surrogateescape") as fp:
+                yield from _iter_lines(fp)
+
+
+def _reconfigure(stream: TextIO) -> None:
+    if isinstance(stream, io.TextIOWrapper):
+        stream.reconfigure(encoding="utf-8", errors="surrogateescape")
+
+
+def _iter_lines(fp: TextIO) -> Iterator[str]:
+    # Only drop the line terminator: padded names are invalid, as they are
+    # for `tz_utils.is_valid_timezone()`.
+    for line in fp:
+        if name := line.rstrip("\r\n"):
+            yield name
+
+
+def _get_group(group: str) -> list:
+    if group == "us":
+        return zones.get_timezones(only_us=True)
+    elif group == "fixed":
+        return zones.get_timezones(only_fixed=True)
+    else:
+        return zones.get_timezones()
+
+
+def _build_caches() -> list[tuple[str, float, int]]:
+    """Build the lazily computed tables through the public API.
+
+    Returns `(name, seconds, entries)` tuples. Tables are built once per
+    process, so the timings are only meaningful in a fresh process.
+    """
+    builders = [
+        (
+            "get_timezones()",
+            lambda: [
+                *zones.get_timezones(only_us=True),
+                *zones.get_timezones(),
+                *zones.get_timezones(only_fixed=True),
+            ],
+        ),
+        ("get_timezones_dict()", zones.get_timezones_dict),
+        (
+            "html_render_timezones()",
+            lambda: tz_rendering.html_render_timezones("timezone").splitlines(),
+        ),
+    ]
+
+    timings = []
+    for name, builder in builders:
+        start = time.perf_counter()
+        table = builder()
+        timings.append((name, time.perf_counter() - start, len(table)))
+    return timings
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m timezones",
+        description="Validate and dump timezone data.",
+    )
+    subparsers = parser.add_subparsers(required=True, metavar="command")
+
+    validate = subparsers.add_parser(
+        "validate",
+        help="validate timezone names, one per line",
+        description="Print invalid timezone names read from FILEs (or stdin). "
+        "Exits with status 1 if any name is invalid.",
+    )
+    validate.add_argument(
+        "files", nargs="*", metavar="FILE", help="input files, '-' for stdin"
+    )
+    validate.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=1000,
+        help="names resolved per batch (default: %(default)s)",
+    )
+    validate.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes, only worth it when lookups are slow, "
+        "e.g. with tzdata on a network filesystem (default: %(default)s)",
+    )
+    validate.add_argument(
+        "--valid",
+        action="store_true",
+        help="print the valid names instead of the invalid ones",
+    )
+    validate.add_argument(
+        "-q", "--quiet", action="store_true", help="don't print the summary"
+    )
+    validate.set_defaults(func=_cmd_validate)
+
+    dump = subparsers.add_parser("dump", help="dump the timezone tables")
+    dump.add_argument("--format", choices=("json", "csv"), default="json")
+    dump.add_argument("--group", choices=_GROUPS, default="all")
+    dump.add_argument("--indent", type=int, default=None, help="JSON indentation")
+    dump.set_defaults(func=_cmd_dump)
+
+    warm = subparsers.add_parser(
+        "warm",
+        help="compile the package bytecode",
+        description="Compile the package bytecode ahead of time. The timezone "
+        "tables are cached in memory only, so they are built by each process "
+        "on first use and can't be pre-built.",
+    )
+    warm.add_argument("-q", "--quiet", action="store_true")
+    warm.set_defaults(func=_cmd_warm)
+
+    stats = subparsers.add_parser(
+        "stats",
+        help="print timing and cache statistics",
+        description="Print the size of each cached table and the time its first "
+        "call took to build it, then the average render time. Tables are built "
+        "once per process, so first call times are only meaningful in a fresh "
+        "process.",
+    )
+    stats.add_argument(
+        "--number",
+        type=_positive_int,
+        default=1000,
+        help="renders to time (default: %(default)s)",
+    )
+    stats.set_defaults(func=_cmd_stats)
+
+    return parser
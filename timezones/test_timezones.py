@@ -1,5 +1,12 @@
+import csv
+import io
+import json
+import subprocess
+import sys
+
 import pytest
 
+from . import _cli as cli
 from . import _defs, tz_rendering, tz_utils, zones
 
 
@@ -74,3 +81,116 @@ def test_aliases(tzname):
     _, name, formatted = tz_utils.format_tz_by_name(tzname)
     assert name == tzname
     assert tzname in formatted
+
+
+def test_html_render_timezones_escapes_labels():
+    html = tz_rendering.html_render_timezones("timezone", "US/Pacific")
+    assert "Pacific Time (US &amp; Canada)" in html
+    assert "(US & Canada)" not in html
+    assert "Nuku&#x27;alofa" in html
+    assert html.count('selected="selected"') == 1
+    assert '<option value="US/Pacific" selected="selected">' in html
+
+
+def test_html_render_timezones_escapes_caller_values():
+    html = tz_rendering.html_render_timezones(
+        '"><script>',
+        "US/Pacific",
+        first_entry="<Select & go>",
+        force_current_selected=True,
+        select_id="a&b",
+    )
+    assert "<script>" not in html
+    assert '<select name="&quot;&gt;&lt;script&gt;" id="a&amp;b">' in html
+    assert '<option value="">&lt;Select &amp; go&gt;</option>' in html
+    assert html.count("Pacific Time (US &amp; Canada)") == 3
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_cli_validate(jobs, monkeypatch, capsys):
+    names = "Europe/Moscow\nEurope/Moscow1\n\nGMT +1:00\nEurope/Moscow1\n"
+    monkeypatch.setattr("sys.stdin", io.StringIO(names))
+    assert cli.main(["validate", "--batch-size", "2", "--jobs", str(jobs)]) == 1
+    out, err = capsys.readouterr()
+    assert out.splitlines() == ["Europe/Moscow1", "Europe/Moscow1"]
+    assert err.strip() == "4 checked, 2 invalid"
+
+
+def test_cli_validate_spawn():
+    # Run `python -m timezones validate -j 2` with workers started by `spawn`
+    # (the default on macOS and Windows), which must be able to import them.
+    script = (
+        "import multiprocessing, runpy, sys\n"
+        "multiprocessing.set_start_method('spawn')\n"
+        "sys.argv = ['timezones', 'validate', '-j', '2']\n"
+        "runpy.run_module('timezones', run_name='__main__', alter_sys=True)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        input="Europe/Moscow\nbad\n",
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+    assert proc.returncode == 1, proc.stderr
+    assert proc.stdout.splitlines() == ["bad"]
+    assert proc.stderr.strip() == "2 checked, 1 invalid"
+
+
+def test_cli_validate_files(tmp_path, capsys):
+    path = tmp_path / "names.txt"
+    path.write_text("Europe/Moscow\nUS/Pacific\n")
+    assert cli.main(["validate", "--quiet", "--valid", str(path)]) == 0
+    out, err = capsys.readouterr()
+    assert out.splitlines() == ["Europe/Moscow", "US/Pacific"]
+    assert err == ""
+
+
+def test_cli_dump(capsys):
+    assert cli.main(["dump", "--group", "us"]) == 0
+    assert json.loads(capsys.readouterr().out) == [
+        list(tz) for tz in zones.get_timezones(only_us=True)
+    ]
+
+    assert cli.main(["dump", "--format", "csv", "--group", "fixed"]) == 0
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert rows[0] == ["offset", "name", "formatted"]
+    assert [tuple(row) for row in rows[1:]] == zones.get_timezones(only_fixed=True)
+
+
+def test_cli_stats(capsys):
+    assert cli.main(["warm", "--quiet"]) == 0
+    assert cli.main(["stats", "--number", "1"]) == 0
+    out = capsys.readouterr().out
+    assert "get_timezones_dict()" in out
+    assert "html_render_timezones" in out
+
+
+def test_cli_validate_undecodable_bytes(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "names.txt"
+    path.write_bytes(b"Europe/Moscow\n\xff\xfeMoscow\n")
+    stdout = io.TextIOWrapper(io.BytesIO())
+    monkeypatch.setattr("sys.stdout", stdout)
+    assert cli.main(["validate", str(path)]) == 1
+    stdout.flush()
+    assert stdout.buffer.getvalue() == b"\xff\xfeMoscow\n"
+    assert capsys.readouterr().err.strip() == "2 checked, 1 invalid"
+
+
+def test_html_render_timezones_lazy_first_entry():
+    class LazyString:
+        def __str__(self):
+            return "Select & go"
+
+    html = tz_rendering.html_render_timezones("timezone", first_entry=LazyString())
+    assert '<option value="">Select &amp; go</option>' in html
+
+
+def test_cli_validate_padded_names(monkeypatch, capsys):
+    names = "Europe/London\r\n Europe/London \nEurope/London\t\n"
+    monkeypatch.setattr("sys.stdin", io.StringIO(names))
+    assert cli.main(["validate"]) == 1
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [" Europe/London ", "Europe/London\t"]
+    assert err.strip() == "3 checked, 2 invalid"
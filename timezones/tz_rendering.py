@@ -20,6 +20,7 @@ Example usage (returns HTML based on current properties)::
 
 from __future__ import annotations
 
+import html
 import json
 from typing import Any
 
@@ -29,7 +30,7 @@ from . import _defs, tz_utils, zones
 def html_render_timezones(
     select_name: str,
     current_selected: str | None = None,
-    first_entry: str = "Select your timezone",
+    first_entry: Any = "Select your timezone",
     force_current_selected: bool = False,
     select_id: Any = None,
     default_timezone: str | None = None,
@@ -56,46 +57,49 @@ def html_render_timezones(
     # Makes it possible to only mark one timezone as selected
     sel_checker = {"non_selected_yet": True}
 
-    def render_option(value, name, selected=False):
+    def render_option(option, selected=False):
         if selected and sel_checker["non_selected_yet"]:
-            is_selected = 'selected="selected"'
             sel_checker["non_selected_yet"] = False
-        else:
-            is_selected = ""
-        return f'<option value="{value}" {is_selected}>{name}</option>'
+            return option[2]
+        return option[1]
 
-    def render_option_disabled():
-        return '<option disabled="disabled">--------------------</option>'
+    option_disabled = '<option disabled="disabled">--------------------</option>'
 
     if select_id:
-        select_elm = f'<select name="{select_name}" id="{select_id}">'
+        select_elm = (
+            f'<select name="{html.escape(str(select_name))}"'
+            f' id="{html.escape(str(select_id))}">'
+        )
     else:
-        select_elm = f'<select name="{select_name}">'
+        select_elm = f'<select name="{html.escape(str(select_name))}">'
 
     result = [select_elm]
 
     if first_entry:
-        result.append(f'<option value="">{first_entry}</option>')
-        result.append(render_option_disabled())
+        result.append(f'<option value="">{html.escape(str(first_entry))}</option>')
+        result.append(option_disabled)
 
     if force_current_selected and current_selected:
         timezone = format_tz(current_selected)
         if timezone:
-            result.append(render_option(timezone[1], timezone[2], True))
-            result.append(render_option_disabled())
+            option = _escape_option(timezone)
+            result.append(render_option(option, True))
+            result.append(option_disabled)
 
-    for tz in zones.get_timezones(only_us=True):
-        result.append(render_option(tz[1], tz[2], current_selected == tz[1]))
+    us_options, all_options, fixed_options = _get_escaped_options()
 
-    result.append(render_option_disabled())
+    for option in us_options:
+        result.append(render_option(option, current_selected == option[0]))
 
-    for tz in zones.get_timezones():
-        result.append(render_option(tz[1], tz[2], current_selected == tz[1]))
+    result.append(option_disabled)
 
-    result.append(render_option_disabled())
+    for option in all_options:
+        result.append(render_option(option, current_selected == option[0]))
 
-    for tz in zones.get_timezones(only_fixed=True):
-        result.append(render_option(tz[1], tz[2], current_selected == tz[1]))
+    result.append(option_disabled)
+
+    for option in fixed_options:
+        result.append(render_option(option, current_selected == option[0]))
 
     result.append("</select>")
 
@@ -121,3 +125,45 @@ def format_tz(tz_name: str) -> _defs.Timezone:
     if tz:
         return tz
     return tz_utils.format_tz_by_name(tz_name)
+
+
+# --- Private ----------------------------------------------
+_EscapedOption = tuple[
+    str,  # timezone name (unescaped, used to match `current_selected`)
+    str,  # escaped <option> HTML
+    str,  # escaped <option> HTML, marked as selected
+]
+
+_EscapedOptions = tuple[
+    list[_EscapedOption],  # US timezones
+    list[_EscapedOption],  # all timezones
+    list[_EscapedOption],  # fixed offsets
+]
+
+
+def _escape_option(tz: _defs.Timezone) -> _EscapedOption:
+    value, name = html.escape(tz[1]), html.escape(tz[2])
+    return (
+        tz[1],
+        f'<option value="{value}" >{name}</option>',
+        f'<option value="{value}" selected="selected">{name}</option>',
+    )
+
+
+def _escape_options(timezones: list[_defs.Timezone]) -> list[_EscapedOption]:
+    return [_escape_option(tz) for tz in timezones]
+
+
+def _get_escaped_options() -> _EscapedOptions:
+    """Return the US, all and fixed timezone options, escaped once and cached."""
+    global _ESCAPED_OPTIONS
+    if _ESCAPED_OPTIONS is None:
+        _ESCAPED_OPTIONS = (
+            _escape_options(zones.get_timezones(only_us=True)),
+            _escape_options(zones.get_timezones()),
+            _escape_options(zones.get_timezones(only_fixed=True)),
+        )
+    return _ESCAPED_OPTIONS
+
+
+_ESCAPED_OPTIONS: _EscapedOptions | None = None